@@ -1,15 +1,24 @@
 """Core game engine for the Town of Salem clone."""
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Iterable
+from functools import partial
+from typing import Iterable, Iterator
 
 import litellm
 
 from roles import ALL_ROLES, Role
 
+# (model, prompt) identifying a narration request.
+NarrationKey = tuple[str, str]
 
-@dataclass
+INTRO_PROMPT = (
+    "Introduce the setting for a Town of Salem style game night in two sentences."
+)
+
+
+@dataclass(slots=True)
 class Player:
     name: str
     role: Role | None = None
@@ -25,6 +34,20 @@ class GameState:
 class GameEngine:
     """Main orchestrator for the Town of Salem clone."""
 
+    # Narration shared across engine instances.
+    _narration_cache: dict[NarrationKey, str] = {}
+    # Requests still awaiting litellm, per event loop, so concurrent callers
+    # share one call without awaiting a task bound to another loop.
+    _narration_inflight: dict[
+        tuple[asyncio.AbstractEventLoop, NarrationKey], asyncio.Task[str]
+    ] = {}
+
+    @classmethod
+    def clear_narration_cache(cls) -> None:
+        """Forget cached narration and in-flight requests shared by all engines."""
+        cls._narration_cache.clear()
+        cls._narration_inflight.clear()
+
     def __init__(self, model: str = "gpt-4o-mini") -> None:
         self.model = model
         self.state = GameState()
@@ -39,21 +62,112 @@ class GameEngine:
 
     def narrate(self, prompt: str) -> str:
         """Generate narration using litellm with the configured model."""
+        key = self._cache_key(prompt)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        response = litellm.completion(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return self._store(key, response["choices"][0]["message"]["content"])
+
+    async def anarrate(self, prompt: str) -> str:
+        """Async variant of ``narrate`` so several prompts can be awaited together."""
+        key = self._cache_key(prompt)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        inflight_key = (loop, key)
+        task = self._narration_inflight.get(inflight_key)
+        if task is None:
+            task = loop.create_task(self._acomplete(key, prompt))
+            self._narration_inflight[inflight_key] = task
+            task.add_done_callback(partial(self._finish_inflight, inflight_key))
+        return await asyncio.shield(task)
+
+    @classmethod
+    def _finish_inflight(
+        cls,
+        inflight_key: tuple[asyncio.AbstractEventLoop, NarrationKey],
+        task: asyncio.Task[str],
+    ) -> None:
+        cls._narration_inflight.pop(inflight_key, None)
+        # Retrieve the outcome so a failure nobody awaits any more is not logged.
+        if not task.cancelled():
+            task.exception()
+
+    async def _acomplete(self, key: NarrationKey, prompt: str) -> str:
+        response = await litellm.acompletion(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return self._store(key, response["choices"][0]["message"]["content"])
+
+    def narrate_stream(self, prompt: str) -> Iterator[str]:
+        """Yield narration chunks as litellm streams them back."""
+        key = self._cache_key(prompt)
+        cached = self._cached(key)
+        if cached is not None:
+            yield cached
+            return
         response = litellm.completion(
             model=self.model,
             messages=[{"role": "user", "content": prompt}],
+            stream=True,
         )
-        return response["choices"][0]["message"]["content"]
+        parts: list[str] = []
+        for chunk in response:
+            content = chunk["choices"][0]["delta"].get("content")
+            if content:
+                parts.append(content)
+                yield content
+        self._store(key, "".join(parts))
+
+    def _cache_key(self, prompt: str) -> NarrationKey:
+        return (self.model, prompt)
+
+    def _cached(self, key: NarrationKey) -> str | None:
+        return self._narration_cache.get(key)
+
+    def _store(self, key: NarrationKey, content: str) -> str:
+        self._narration_cache[key] = content
+        return content
 
     def run(self) -> None:
+        self._ensure_players()
+        for chunk in self.narrate_stream(INTRO_PROMPT):
+            print(chunk, end="", flush=True)
+        print()
+        self._print_roles()
+
+    async def arun(self) -> None:
+        """Async variant of ``run`` so independent games can be gathered.
+
+        Narration is printed whole rather than streamed so concurrent games
+        do not interleave their output.
+        """
+        self._ensure_players()
+        intro = await self.anarrate(INTRO_PROMPT)
+        print(intro)
+        self._print_roles()
+
+    def _ensure_players(self) -> None:
         if not self.state.players:
             self.add_players(["Alice", "Ben", "Casey", "Drew", "Emery"])
 
-        intro = self.narrate(
-            "Introduce the setting for a Town of Salem style game night in two sentences."
-        )
-        print(intro)
+    def _print_roles(self) -> None:
         print("Assigned roles:")
         for player in self.state.players:
             role_name = player.role.name if player.role else "Unassigned"
             print(f"- {player.name}: {role_name}")
+
+
+async def run_games(game_count: int) -> None:
+    """Run independent games concurrently, sharing their narration requests.
+
+    Games do not differ yet: every engine gets the default players, the same
+    role order and the same cached intro. This is plumbing for when they do.
+    """
+    await asyncio.gather(*(GameEngine().arun() for _ in range(game_count)))
@@ -1,11 +1,34 @@
 """Entry point for the Town of Salem clone."""
-from engine import GameEngine
+import argparse
+import asyncio
 
+from engine import GameEngine, run_games
 
-def main() -> None:
+
+def _positive_int(value: str) -> int:
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from None
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {count}")
+    return count
+
+
+def main(game_count: int = 1) -> None:
+    if game_count > 1:
+        asyncio.run(run_games(game_count))
+        return
     engine = GameEngine()
     engine.run()
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--games",
+        type=_positive_int,
+        default=1,
+        help="number of games to run concurrently (default: 1)",
+    )
+    main(parser.parse_args().games)
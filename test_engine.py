@@ -0,0 +1,105 @@
+"""Tests for narration caching in the game engine."""
+import asyncio
+
+import pytest
+
+import engine
+from engine import GameEngine
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    GameEngine.clear_narration_cache()
+    yield
+    GameEngine.clear_narration_cache()
+
+
+def _response(content):
+    return {"choices": [{"message": {"content": content}}]}
+
+
+def test_narrate_caches_repeated_prompts(monkeypatch):
+    calls = []
+
+    def completion(**kwargs):
+        calls.append(kwargs)
+        return _response("Fog rolls in.")
+
+    monkeypatch.setattr(engine.litellm, "completion", completion)
+
+    assert GameEngine().narrate("intro") == "Fog rolls in."
+    assert GameEngine().narrate("intro") == "Fog rolls in."
+    assert len(calls) == 1
+
+
+def test_concurrent_anarrate_makes_one_request(monkeypatch):
+    calls = []
+
+    async def acompletion(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        return _response("Fog rolls in.")
+
+    monkeypatch.setattr(engine.litellm, "acompletion", acompletion)
+
+    async def gather():
+        return await asyncio.gather(*(GameEngine().anarrate("intro") for _ in range(4)))
+
+    assert asyncio.run(gather()) == ["Fog rolls in."] * 4
+    assert len(calls) == 1
+    assert GameEngine._narration_inflight == {}
+
+
+def test_failed_anarrate_is_not_cached(monkeypatch):
+    async def acompletion(**kwargs):
+        await asyncio.sleep(0.01)
+        raise RuntimeError("backend down")
+
+    monkeypatch.setattr(engine.litellm, "acompletion", acompletion)
+
+    async def gather():
+        return await asyncio.gather(
+            *(GameEngine().anarrate("intro") for _ in range(3)),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(gather())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert GameEngine._narration_cache == {}
+    assert GameEngine._narration_inflight == {}
+
+
+def test_run_games_shares_one_request(monkeypatch, capsys):
+    calls = []
+
+    async def acompletion(**kwargs):
+        calls.append(kwargs)
+        await asyncio.sleep(0.01)
+        return _response("Fog rolls in.")
+
+    monkeypatch.setattr(engine.litellm, "acompletion", acompletion)
+
+    asyncio.run(engine.run_games(3))
+
+    output = capsys.readouterr().out
+    assert len(calls) == 1
+    assert output.count("Assigned roles:") == 3
+    assert output.count("- Emery: Consigliere") == 3
+
+
+def test_narrate_stream_closed_early_is_not_cached(monkeypatch):
+    def completion(**kwargs):
+        assert kwargs["stream"] is True
+        return iter(
+            [{"choices": [{"delta": {"content": part}}]} for part in ("Fog ", "rolls in.")]
+        )
+
+    monkeypatch.setattr(engine.litellm, "completion", completion)
+
+    stream = GameEngine().narrate_stream("intro")
+    assert next(stream) == "Fog "
+    stream.close()
+    assert GameEngine._narration_cache == {}
+
+    assert "".join(GameEngine().narrate_stream("intro")) == "Fog rolls in."
+    assert GameEngine._narration_cache == {("gpt-4o-mini", "intro"): "Fog rolls in."}